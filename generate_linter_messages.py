@@ -1,6 +1,7 @@
 """Continuously generates linter messages for the dataset specified by path."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from tqdm import tqdm
@@ -13,6 +14,9 @@ if len(sys.argv) != 2:
     sys.exit(1)
 data_path = Path(sys.argv[1])
 
+# number of submissions handed to the linter workers at once, results are written after each chunk
+CHUNK_SIZE = 1000
+
 log = load_log(data_path)
 
 with open(data_path / "messages.txt", "a+") as f:
@@ -27,6 +31,14 @@ with open(data_path / "messages.txt", "a+") as f:
     print(" Done. Processed {}/{} rows.".format(len(processed_indices), len(log)))
 
     print("Generating linter messages...")
-    for i, row in tqdm(log.iterrows()):
-        f.write(str((i, generate_linter_messages(row["answer"]))) + "\n")
+    indices = log.index.to_list()
+    answers = log["answer"].to_list()
+    # each call spends its time waiting on the linter subprocess, so threads are enough to use all cores
+    with ThreadPoolExecutor() as executor, tqdm(total=len(log), mininterval=1.0) as progress:
+        for start in range(0, len(log), CHUNK_SIZE):
+            chunk = answers[start : start + CHUNK_SIZE]
+            for i, messages in zip(indices[start : start + CHUNK_SIZE], executor.map(generate_linter_messages, chunk)):
+                f.write(str((i, messages)) + "\n")
+                progress.update()
+            f.flush()
     print(" Done.")
@@ -12,6 +12,9 @@ import pandas as pd
 
 from src.code_processing import decode_code_string
 
+LOG_COLUMNS = ["id", "user", "item", "answer", "correct", "responseTime", "time"]
+ITEM_COLUMNS = ["name", "instructions", "solution"]
+
 
 def load_log(data_path: Path) -> pd.DataFrame:
     """Load and clean the ipython log database.
@@ -25,27 +28,40 @@ def load_log(data_path: Path) -> pd.DataFrame:
     print("Loading log...", end="")
     if data_path.is_dir():
         data_path = data_path / "log.csv"
-    log = pd.read_csv(data_path, sep=";")
+    log = pd.read_csv(
+        data_path,
+        sep=";",
+        usecols=LOG_COLUMNS,
+        parse_dates=["time"],
+        true_values=["t"],
+        false_values=["f"],
+    )
     print(" Done. Found {} values.".format(len(log)))
 
     print("Cleaning...")
+    duplicated = log.duplicated()
+    missing = log.isna().any(axis=1) & ~duplicated
+    log = log.loc[~(duplicated | missing)]
+    print("\tDropped {} duplicates.".format(duplicated.sum()))
+    print("\tDropped {} rows with missing values.".format(missing.sum()))
     len_before = len(log)
-    log.drop_duplicates(inplace=True)
-    print("\tDropped {} duplicates.".format(len_before - (len_before := len(log))))
-    log.dropna(inplace=True)
-    print("\tDropped {} rows with missing values.".format(len_before - (len_before := len(log))))
 
     print("\tConverting types...")
-    print("\t\tTime...", end="")
-    log["time"] = pd.to_datetime(log["time"])
-    print(" Done.")
     print("\t\tCorrect...", end="")
-    log["correct"] = log["correct"].astype(bool)
+    log = log.astype({"correct": bool})
+    print(" Done.")
+    print("\t\tIdentifiers...", end="")
+    log = log.astype({"id": "int32", "user": "int32", "item": "int32"})
+    print(" Done.")
+    print("\t\tUsers and items...", end="")
+    log = log.astype({"user": "category", "item": "category"})
     print(" Done.")
     print("\tDone.")
 
     print("\tDecoding submissions...", end="")
-    log["answer"] = log["answer"].apply(decode_code_string)
+    # students often resubmit the same program, so decode every distinct answer only once
+    decoded = {answer: decode_code_string(answer) for answer in log["answer"].unique()}
+    log["answer"] = log["answer"].map(decoded)
     print(" Done.")
     ## discard submissions with empty answers
     print("\tDropped {} rows with empty submissions.".format(len_before - (len_before := len(log))))
@@ -70,13 +86,14 @@ def load_item(data_path: Path) -> pd.DataFrame:
     print("Loading item...", end="")
     if data_path.is_dir():
         data_path = data_path / "item.csv"
-    item = pd.read_csv(data_path, sep=";", index_col=0)
+    # the header tells the parser which columns to skip, the first one holds the index
+    columns = pd.read_csv(data_path, sep=";", nrows=0).columns
+    item = pd.read_csv(data_path, sep=";", usecols=[columns[0], *ITEM_COLUMNS], index_col=0)
     print("Done.")
 
     print("Cleaning...")
-    num_columns = item.shape[1]
-    item = item[["name", "instructions", "solution"]]
-    print("\tDropped {} irrelevant columns".format(num_columns - item.shape[1]))
+    item = item[ITEM_COLUMNS]
+    print("\tDropped {} irrelevant columns".format(len(columns) - 1 - item.shape[1]))
 
     print("\tDecoding instructions and solutions...", end="")
     item["instructions"] = item["instructions"].apply(lambda x: eval(x)[0][1])
@@ -4,11 +4,23 @@ import unittest
 
 from src.code_processing import *
 
+# encoded submissions and the programs they should decode to
+DECODING_CASES = [
+    ("ZGVmIGltcG9zZV9maW5lKGFnZSwgYmVlcik6CiAgICByZXR1cm4gRmFsc2UK", "def impose_fine(age, beer):\n    return False"),
+    ("eCA9IDEgPD4gMgo=", "x = 1 != 2"),
+]
+
 
 class CodeProcessingTest(unittest.TestCase):
     """Tests the code processing module."""
 
     def test_sanity(self):
         """Basic sanity test."""
-        code = "ZGVmIGltcG9zZV9maW5lKGFnZSwgYmVlcik6CiAgICByZXR1cm4gRmFsc2UK"
-        self.assertEqual(decode_code_string(code), "def impose_fine(age, beer):\n    return False")
+        code, expected = DECODING_CASES[0]
+        self.assertEqual(decode_code_string(code), expected)
+
+    def test_decoding(self):
+        """Encoded submissions are decoded and their quirks fixed."""
+        for code, expected in DECODING_CASES:
+            with self.subTest(code=code):
+                self.assertEqual(decode_code_string(code), expected)
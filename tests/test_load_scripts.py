@@ -0,0 +1,69 @@
+"""Tests the modules related to loading the data."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.load_scripts import load_item, load_log
+
+ANSWER = "ZGVmIGltcG9zZV9maW5lKGFnZSwgYmVlcik6CiAgICByZXR1cm4gRmFsc2UK"
+
+
+class LoadLogTest(unittest.TestCase):
+    """Tests loading of the ipython log."""
+
+    def setUp(self):
+        """Write a small log to a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.temp_dir.name)
+        rows = [
+            "id;user;item;answer;correct;responseTime;time;ignored",
+            f"1;10;100;{ANSWER};t;5;2023-01-01 10:00:00;x",
+            f"1;10;100;{ANSWER};t;5;2023-01-01 10:00:00;x",
+            f"2;11;100;{ANSWER};f;7;2023-01-02 10:00:00;y",
+            f"3;11;101;;f;7;2023-01-03 10:00:00;z",
+        ]
+        (self.data_path / "log.csv").write_text("\n".join(rows) + "\n")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_load_log(self):
+        """Duplicates and incomplete rows are dropped and columns get their final types."""
+        log = load_log(self.data_path)
+        self.assertEqual(list(log.columns), ["id", "user", "item", "answer", "correct", "responseTime", "time"])
+        self.assertEqual(list(log["id"]), [1, 2])
+        self.assertEqual(list(log["correct"]), [True, False])
+        self.assertEqual(log["correct"].dtype, bool)
+        self.assertEqual(log["id"].dtype, "int32")
+        self.assertEqual(log["user"].dtype, "category")
+        self.assertEqual(list(log["user"].cat.categories), [10, 11])
+        self.assertTrue(str(log["time"].dtype).startswith("datetime64"))
+        self.assertEqual(log["answer"].iloc[0], "def impose_fine(age, beer):\n    return False")
+
+
+class LoadItemTest(unittest.TestCase):
+    """Tests loading of the ipython items."""
+
+    def setUp(self):
+        """Write a small item table to a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_path = Path(self.temp_dir.name)
+        rows = [
+            "id;name;instructions;solution;ignored",
+            f"100;fine;[['cs', 'Write a function.']];[['cs', '{ANSWER}']];x",
+        ]
+        (self.data_path / "item.csv").write_text("\n".join(rows) + "\n")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.temp_dir.cleanup()
+
+    def test_load_item(self):
+        """Only the relevant columns are kept and the solutions are decoded."""
+        item = load_item(self.data_path)
+        self.assertEqual(list(item.columns), ["name", "instructions", "solution"])
+        self.assertEqual(list(item.index), [100])
+        self.assertEqual(item.loc[100, "instructions"], "Write a function.")
+        self.assertEqual(item.loc[100, "solution"], "def impose_fine(age, beer):\n    return False")